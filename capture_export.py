@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+캡처 내보내기 파이프라인
+수신/송신 로그("[HH:MM:SS.mmm] RX: ...")를 CSV, JSON Lines, Parquet/Arrow로 변환
+레코드를 일정 크기 배치로 스트리밍 처리하므로 대용량 캡처도 메모리에 모두 올리지 않음
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet/Arrow 내보내기는 pyarrow가 있을 때만 사용
+    pa = None
+    pq = None
+
+
+FORMATS = ('csv', 'jsonl', 'parquet', 'arrow')
+FORMAT_EXTENSIONS = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet', 'arrow': '.arrow'}
+FIELDS = ('line_no', 'timestamp', 'direction', 'data')
+
+DEFAULT_BATCH_SIZE = 10000
+
+# "[12:34:56.789] RX: data" / "[12:34:56.789] RX (HEX): 41 42" / "[12:34:56.789] TX: data"
+# 라인 간격 표시가 켜져 있으면 "[12:34:56.789 +12.345ms] RX: data"
+_LINE_PATTERN = re.compile(r'^\[(\d{2}:\d{2}:\d{2}\.\d{3})(?: [+-]\d+\.\d+ms)?\] (RX \(HEX\)|RX|TX): ?(.*)$')
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+ExportResult = namedtuple('ExportResult', 'source destination records bytes_in seconds')
+
+
+def parse_capture_line(line_no, line):
+    """로그 한 줄을 레코드 튜플로 변환 (형식이 다르면 원문을 data로 보존)"""
+    line = line.rstrip('\r\n')
+    match = _LINE_PATTERN.match(line)
+    if match:
+        timestamp, direction, data = match.groups()
+        return (line_no, timestamp, direction, data)
+    return (line_no, None, None, line)
+
+
+def iter_batches(lines, batch_size=DEFAULT_BATCH_SIZE):
+    """임의의 라인 이터러블을 레코드 배치(list)로 묶어서 반환"""
+    batch = []
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        batch.append(parse_capture_line(line_no, line))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class CsvExporter:
+    """CSV 내보내기"""
+
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(FIELDS)
+
+    def write_batch(self, batch):
+        self.writer.writerows(batch)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlExporter:
+    """JSON Lines 내보내기"""
+
+    def __init__(self, path):
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write_batch(self, batch):
+        # 레코드마다 dict를 만들지 않고 필드 값만 인코딩
+        encode = _JSON_ENCODER.encode
+        self.file.write(''.join(
+            f'{{"line_no": {line_no}, "timestamp": {encode(timestamp)}, '
+            f'"direction": {encode(direction)}, "data": {encode(data)}}}\n'
+            for line_no, timestamp, direction, data in batch
+        ))
+
+    def close(self):
+        self.file.close()
+
+
+class ArrowExporter:
+    """Parquet / Arrow IPC 내보내기 (pyarrow 필요)"""
+
+    def __init__(self, path, fmt):
+        if pa is None:
+            raise RuntimeError("Parquet/Arrow 내보내기에는 pyarrow가 필요합니다: pip install pyarrow")
+
+        self.schema = pa.schema([
+            ('line_no', pa.int64()),
+            ('timestamp', pa.string()),
+            ('direction', pa.string()),
+            ('data', pa.string()),
+        ])
+        if fmt == 'parquet':
+            self.writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self.sink = pa.OSFile(path, 'wb')
+            self.writer = pa.ipc.new_file(self.sink, self.schema)
+
+    def write_batch(self, batch):
+        columns = list(zip(*batch))
+        self.writer.write_table(pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, self.schema)],
+            schema=self.schema
+        ))
+
+    def close(self):
+        self.writer.close()
+        if hasattr(self, 'sink'):
+            self.sink.close()
+
+
+def create_exporter(path, fmt):
+    """포맷별 내보내기 객체 생성"""
+    if fmt == 'csv':
+        return CsvExporter(path)
+    elif fmt == 'jsonl':
+        return JsonlExporter(path)
+    elif fmt in ('parquet', 'arrow'):
+        return ArrowExporter(path, fmt)
+    raise ValueError(f"지원하지 않는 포맷: {fmt} (사용 가능: {', '.join(FORMATS)})")
+
+
+def export_lines(lines, destination, fmt, batch_size=DEFAULT_BATCH_SIZE):
+    """라인 이터러블(실시간 세션 등)을 내보내고 레코드 수 반환"""
+    exporter = create_exporter(destination, fmt)
+    records = 0
+    try:
+        for batch in iter_batches(lines, batch_size):
+            exporter.write_batch(batch)
+            records += len(batch)
+    finally:
+        exporter.close()
+    return records
+
+
+def default_destination(source, fmt, output_dir=None):
+    """출력 경로 생성: 같은 이름에 확장자만 변경"""
+    base = os.path.splitext(os.path.basename(source))[0] + FORMAT_EXTENSIONS[fmt]
+    return os.path.join(output_dir or os.path.dirname(os.path.abspath(source)), base)
+
+
+def _same_file(path, other):
+    """두 경로가 같은 파일인지 확인 (아직 없는 파일은 절대 경로로 비교)"""
+    if os.path.exists(path) and os.path.exists(other):
+        return os.path.samefile(path, other)
+    return os.path.abspath(path) == os.path.abspath(other)
+
+
+def check_destination(source, destination, sources=None):
+    """출력 파일이 입력 파일을 덮어쓰지 않는지 확인 (덮어쓰면 ValueError)"""
+    for path in sources or [source]:
+        if _same_file(destination, path):
+            raise ValueError(f"출력 파일이 입력 파일과 같습니다: {destination} (-o로 다른 디렉터리를 지정하세요)")
+
+
+def unique_destinations(destinations):
+    """출력 경로가 겹치면 "이름-1.확장자" 형식으로 구분"""
+    used, result = set(), []
+    for destination in destinations:
+        base, ext = os.path.splitext(destination)
+        candidate, counter = destination, 1
+        while os.path.abspath(candidate) in used:
+            candidate = f"{base}-{counter}{ext}"
+            counter += 1
+        used.add(os.path.abspath(candidate))
+        result.append(candidate)
+    return result
+
+
+def export_capture(source, destination=None, fmt='csv', batch_size=DEFAULT_BATCH_SIZE):
+    """캡처 파일 하나를 스트리밍 변환"""
+    destination = destination or default_destination(source, fmt)
+    check_destination(source, destination)
+    started = time.perf_counter()
+    with open(source, 'r', encoding='utf-8', errors='replace') as f:
+        records = export_lines(f, destination, fmt, batch_size)
+    return ExportResult(source, destination, records, os.path.getsize(source),
+                        time.perf_counter() - started)
+
+
+def export_captures(sources, output_dir=None, fmt='csv', jobs=1, batch_size=DEFAULT_BATCH_SIZE):
+    """여러 캡처 파일 변환 (jobs > 1이면 프로세스 풀에서 병렬 처리)"""
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    destinations = unique_destinations(
+        [default_destination(source, fmt, output_dir) for source in sources]
+    )
+    # 변환을 시작하기 전에 모든 출력 경로를 검사 (일부만 변환된 채로 실패하지 않도록)
+    for source, destination in zip(sources, destinations):
+        check_destination(source, destination, sources)
+
+    if jobs <= 1 or len(sources) <= 1:
+        return [export_capture(source, destination, fmt, batch_size)
+                for source, destination in zip(sources, destinations)]
+
+    # GUI(QThread)에서도 호출되므로 멀티스레드 프로세스를 fork하지 않도록 spawn 사용
+    with ProcessPoolExecutor(max_workers=jobs,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        return list(pool.map(export_capture, sources, destinations,
+                             [fmt] * len(sources), [batch_size] * len(sources)))
+
+
+def throughput_mb_s(bytes_in, seconds):
+    """처리량 (MB/s)"""
+    return bytes_in / (1024 * 1024) / seconds if seconds > 0 else 0.0
+
+
+def format_result(result):
+    """변환 결과 요약 문자열"""
+    return (f"{result.source} -> {result.destination}: {result.records} 레코드, "
+            f"{result.bytes_in / (1024 * 1024):.1f}MB, "
+            f"{throughput_mb_s(result.bytes_in, result.seconds):.1f} MB/s")
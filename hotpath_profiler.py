@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+핫패스 프로파일링 훅
+수신/표시/전송 단계별 이름 있는 구간(span)을 측정해 Chrome trace / speedscope JSON과
+단계별 지연 히스토그램으로 내보냄
+
+비활성화 상태에서는 sampled()가 아무것도 기록하지 않는 구간 팩토리를 돌려주므로
+호출 지점의 비용은 함수 호출 한 번 수준이다. 활성화 여부는 enable() 시점에 한 번만
+결정되며 구간마다 검사하지 않는다.
+
+사용 예:
+    span = PROFILER.sampled("SerialWorker.run")
+    with span("serial.read"):
+        data = port.read(n)
+
+스레드 간 구간(예: 시그널 전달)은 보내는 쪽에서 span.stamp()로 시각을 남기고
+받는 쪽에서 PROFILER.record(name, start_ns)로 기록한다. 측정하지 않는 작업 단위에서는
+stamp()가 None을 반환한다.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+
+DEFAULT_TRACE_PATH = "mcu_profile_trace.json"
+DEFAULT_SAMPLE_EVERY = 4
+DEFAULT_MAX_EVENTS = 200000
+
+# 히스토그램 버킷 개수: 2^0us ~ 2^24us(약 16초)
+_HISTOGRAM_BUCKETS = 25
+
+
+class _NullSpan:
+    """아무것도 기록하지 않는 구간"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _NullSpanFactory:
+    """측정하지 않는 작업 단위의 구간 팩토리"""
+    __slots__ = ()
+
+    def __call__(self, name):
+        return _NULL_SPAN
+
+    def stamp(self):
+        return None
+
+
+_NULL_FACTORY = _NullSpanFactory()
+
+
+def _null_sampled(name):
+    return _NULL_FACTORY
+
+
+class _Span:
+    """실제 시간을 측정하는 구간"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class _SpanFactory:
+    """측정하는 작업 단위의 구간 팩토리"""
+    __slots__ = ('profiler',)
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def __call__(self, name):
+        return _Span(self.profiler, name)
+
+    def stamp(self):
+        """스레드 간 구간의 시작 시각 (PROFILER.record()에 전달)"""
+        return time.perf_counter_ns()
+
+
+class StageHistogram:
+    """단계별 지연 히스토그램 (log2 마이크로초 버킷)"""
+
+    def __init__(self):
+        self.buckets = [0] * _HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, duration_ns):
+        index = min((duration_ns // 1000).bit_length(), _HISTOGRAM_BUCKETS - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def percentile_us(self, fraction):
+        """버킷 상한으로 근사한 백분위수 (us)"""
+        target = self.count * fraction
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return 1 << index
+        return 0
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean_us': self.total_ns / self.count / 1000 if self.count else 0.0,
+            'max_us': self.max_ns / 1000,
+            'p50_us': self.percentile_us(0.5),
+            'p99_us': self.percentile_us(0.99),
+            # 키: 버킷 상한(us), 값: 횟수
+            'buckets': {str(1 << i): c for i, c in enumerate(self.buckets) if c},
+        }
+
+
+class HotPathProfiler:
+    """결정적 샘플링 핫패스 프로파일러"""
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_every = 1
+        self.events = deque(maxlen=DEFAULT_MAX_EVENTS)
+        self.histograms = {}
+        self.origin_ns = time.perf_counter_ns()
+        self.sampled = _null_sampled
+        self._factory = _SpanFactory(self)
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def enable(self, sample_every=DEFAULT_SAMPLE_EVERY, max_events=DEFAULT_MAX_EVENTS):
+        """프로파일링 활성화 (작업 단위 N개마다 1개를 측정)"""
+        self.enabled = True
+        self.sample_every = max(1, int(sample_every))
+        self.events = deque(maxlen=max_events)
+        self.origin_ns = time.perf_counter_ns()
+        self.sampled = self._sampled
+
+    def _sampled(self, name):
+        """작업 단위(name)별 카운터로 N번째마다 측정 구간 팩토리 반환"""
+        count = self._counters.get(name, 0)
+        self._counters[name] = count + 1
+        if count % self.sample_every:
+            return _NULL_FACTORY
+        return self._factory
+
+    def record(self, name, start_ns, end_ns=None):
+        """다른 스레드에서 시작된 구간 기록 (start_ns: span.stamp() 값)"""
+        self._record(name, start_ns, time.perf_counter_ns() if end_ns is None else end_ns)
+
+    def _record(self, name, start_ns, end_ns):
+        thread_id = threading.get_ident()
+        with self._lock:
+            self.events.append((name, thread_id, start_ns, end_ns))
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = StageHistogram()
+            histogram.add(end_ns - start_ns)
+
+    def _snapshot(self):
+        with self._lock:
+            return list(self.events)
+
+    def chrome_trace(self):
+        """Chrome trace (chrome://tracing, Perfetto) 형식"""
+        pid = os.getpid()
+        trace_events = [
+            {
+                'name': name, 'cat': 'hotpath', 'ph': 'X', 'pid': pid, 'tid': thread_id,
+                'ts': (start - self.origin_ns) / 1000, 'dur': (end - start) / 1000,
+            }
+            for name, thread_id, start, end in self._snapshot()
+        ]
+        return {
+            'traceEvents': trace_events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'sample_every': self.sample_every},
+        }
+
+    def speedscope(self):
+        """speedscope evented 프로파일 형식 (스레드별 프로파일)"""
+        frames, frame_index = [], {}
+        by_thread = {}
+        for name, thread_id, start, end in self._snapshot():
+            if name not in frame_index:
+                frame_index[name] = len(frames)
+                frames.append({'name': name})
+            by_thread.setdefault(thread_id, []).append((start, end, frame_index[name]))
+
+        profiles = []
+        for thread_id, spans in by_thread.items():
+            spans.sort(key=lambda span: (span[0], -span[1]))
+            events, stack = [], []
+            for start, end, frame in spans:
+                # 현재 구간 시작 전에 끝난 구간부터 닫음
+                while stack and stack[-1][0] <= start:
+                    closed_end, closed_frame = stack.pop()
+                    events.append({'type': 'C', 'frame': closed_frame, 'at': closed_end - self.origin_ns})
+                if stack:
+                    end = min(end, stack[-1][0])
+                events.append({'type': 'O', 'frame': frame, 'at': start - self.origin_ns})
+                stack.append((end, frame))
+            while stack:
+                closed_end, closed_frame = stack.pop()
+                events.append({'type': 'C', 'frame': closed_frame, 'at': closed_end - self.origin_ns})
+
+            profiles.append({
+                'type': 'evented',
+                'name': f"thread {thread_id}",
+                'unit': 'nanoseconds',
+                'startValue': events[0]['at'],
+                'endValue': events[-1]['at'],
+                'events': events,
+            })
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': profiles,
+            'name': 'MCU serial hot path',
+            'exporter': 'hotpath_profiler',
+        }
+
+    def histogram_report(self):
+        """단계별 지연 히스토그램"""
+        with self._lock:
+            return {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())}
+
+    def format_summary(self):
+        """단계별 지연 요약 문자열"""
+        lines = [f"{'단계':<24}{'횟수':>8}{'평균(us)':>12}{'p50(us)':>10}{'p99(us)':>10}{'최대(us)':>12}"]
+        for name, stats in self.histogram_report().items():
+            lines.append(f"{name:<24}{stats['count']:>8}{stats['mean_us']:>12.1f}"
+                         f"{stats['p50_us']:>10}{stats['p99_us']:>10}{stats['max_us']:>12.1f}")
+        return "\n".join(lines)
+
+    def export(self, path=DEFAULT_TRACE_PATH):
+        """trace 파일 저장: PATH(Chrome trace), *.speedscope.json, *.histograms.json"""
+        base = path[:-5] if path.endswith('.json') else path
+        outputs = [
+            (path, self.chrome_trace()),
+            (base + '.speedscope.json', self.speedscope()),
+            (base + '.histograms.json', self.histogram_report()),
+        ]
+        for output_path, content in outputs:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(content, f)
+        return [output_path for output_path, _ in outputs]
+
+
+PROFILER = HotPathProfiler()
+
+
+def init_profile_trace(argv):
+    """--profile-trace [PATH.json], --profile-sample N 옵션 처리
+
+    옵션이 있으면 프로파일러를 활성화하고 종료 시 trace를 저장한다.
+    반환: 프로파일링 옵션을 제거한 argv
+    """
+    remaining, trace_path, sample_value = [], None, None
+    args = iter(enumerate(argv))
+    for index, arg in args:
+        if arg == '--profile-trace':
+            trace_path = DEFAULT_TRACE_PATH
+            # 다음 인수가 .json 파일이면 경로로 사용 (서브커맨드와 혼동 방지)
+            if index + 1 < len(argv) and argv[index + 1].endswith('.json'):
+                trace_path = next(args)[1]
+        elif arg.startswith('--profile-trace='):
+            trace_path = arg.split('=', 1)[1] or DEFAULT_TRACE_PATH
+        elif arg == '--profile-sample':
+            sample_value = next(args, (None, ''))[1]
+        elif arg.startswith('--profile-sample='):
+            sample_value = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+
+    sample_every = DEFAULT_SAMPLE_EVERY
+    if sample_value is not None:
+        if not trace_path:
+            _usage_error("--profile-sample은 --profile-trace와 함께 사용해야 합니다.")
+        try:
+            sample_every = int(sample_value)
+        except ValueError:
+            sample_every = 0
+        if sample_every < 1:
+            _usage_error(f"--profile-sample 값은 1 이상의 정수여야 합니다: {sample_value}")
+
+    if trace_path:
+        PROFILER.enable(sample_every)
+        atexit.register(_export_at_exit, trace_path)
+    return remaining
+
+
+def _usage_error(message):
+    """프로파일링 옵션 오류 출력 후 종료"""
+    print(f"❌ {message}")
+    print(f"사용법: {os.path.basename(sys.argv[0])} --profile-trace [PATH.json] [--profile-sample N]")
+    sys.exit(2)
+
+
+def _export_at_exit(trace_path):
+    """종료 시 trace 저장 및 요약 출력"""
+    try:
+        paths = PROFILER.export(trace_path)
+    except OSError as e:
+        print(f"❌ 프로파일 저장 오류: {e}")
+        return
+    print("\n=== 핫패스 프로파일 ===")
+    print(PROFILER.format_summary())
+    print("저장됨: " + ", ".join(paths))
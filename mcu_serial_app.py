@@ -4,6 +4,7 @@ MCU RS232 통신 애플리케이션
 PySide6와 pyserial을 사용한 안정적인 시리얼 통신 프로그램
 """
 
+import os
 import sys
 import serial
 import serial.tools.list_ports
@@ -11,18 +12,29 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
     QWidget, QComboBox, QPushButton, QTextEdit, QLineEdit,
     QLabel, QGroupBox, QSpinBox, QCheckBox, QStatusBar,
-    QSplitter, QMessageBox, QGridLayout
+    QSplitter, QMessageBox, QGridLayout, QFileDialog, QInputDialog
 )
 from PySide6.QtCore import QTimer, QThread, Signal, QMutex
-from PySide6.QtGui import QFont, QTextCursor, QColor, QPalette
+from PySide6.QtGui import QFont, QTextCursor, QColor, QPalette, QIntValidator
 import time
 import threading
-from datetime import datetime
+
+from serial_link import (
+    STANDARD_BAUDRATES, MIN_BAUDRATE, MAX_BAUDRATE, DEFAULT_READ_CHUNK_SIZE, MAX_READ_CHUNK_SIZE,
+    parse_baudrate, probe_baudrate, apply_low_latency, restore_low_latency
+)
+from capture_export import (
+    FORMATS, FORMAT_EXTENSIONS, export_lines, export_captures, format_result
+)
+from hotpath_profiler import PROFILER, init_profile_trace
+from timestamp_engine import ArrivalClock, LineAssembler, LineTiming, byte_time_ns, format_delta
+from session_diff import SessionDiff
 
 
 class SerialWorker(QThread):
     """시리얼 통신을 처리하는 별도 스레드"""
-    data_received = Signal(str)
+    # (라인 첫 바이트/개행 도착 시각 monotonic ns, 데이터, 시그널 전달 측정용 emit 시각 - 측정하지 않으면 None)
+    data_received = Signal(object, object, str, object)
     connection_status = Signal(bool, str)
     
     def __init__(self):
@@ -30,11 +42,16 @@ class SerialWorker(QThread):
         self.serial_port = None
         self.is_running = False
         self.mutex = QMutex()
+        self.read_chunk_size = DEFAULT_READ_CHUNK_SIZE
+        self.clock = ArrivalClock()
+        self.byte_ns = byte_time_ns(115200)
         
-    def connect_serial(self, port, baudrate, databits, stopbits, parity):
+    def connect_serial(self, port, baudrate, databits, stopbits, parity,
+                       low_latency=False, read_chunk_size=DEFAULT_READ_CHUNK_SIZE):
         """시리얼 포트 연결"""
         try:
             if self.serial_port and self.serial_port.is_open:
+                restore_low_latency(self.serial_port)
                 self.serial_port.close()
                 
             self.serial_port = serial.Serial(
@@ -50,7 +67,15 @@ class SerialWorker(QThread):
             )
             
             if self.serial_port.is_open:
-                self.connection_status.emit(True, f"연결됨: {port}")
+                self.read_chunk_size = read_chunk_size
+                self.byte_ns = byte_time_ns(baudrate, databits, parity, stopbits)
+                self.clock.anchor()
+                message = f"연결됨: {port} ({baudrate} bps)"
+                if low_latency:
+                    applied = apply_low_latency(self.serial_port)
+                    if applied:
+                        message += f" [저지연: {', '.join(applied)}]"
+                self.connection_status.emit(True, message)
                 return True
             else:
                 self.connection_status.emit(False, "연결 실패")
@@ -64,6 +89,7 @@ class SerialWorker(QThread):
         """시리얼 포트 연결 해제"""
         try:
             if self.serial_port and self.serial_port.is_open:
+                restore_low_latency(self.serial_port)
                 self.serial_port.close()
             self.connection_status.emit(False, "연결 해제됨")
         except Exception as e:
@@ -73,8 +99,14 @@ class SerialWorker(QThread):
         """데이터 전송"""
         try:
             if self.serial_port and self.serial_port.is_open:
-                self.serial_port.write(data.encode('utf-8'))
-                self.serial_port.flush()
+                span = PROFILER.sampled("SerialWorker.send_data")
+                with span("SerialWorker.send_data"):
+                    with span("encode"):
+                        payload = data.encode('utf-8')
+                    with span("serial.write"):
+                        self.serial_port.write(payload)
+                    with span("serial.flush"):
+                        self.serial_port.flush()
                 return True
         except Exception as e:
             self.connection_status.emit(False, f"전송 오류: {str(e)}")
@@ -83,29 +115,41 @@ class SerialWorker(QThread):
     def run(self):
         """스레드 실행 - 데이터 수신 대기"""
         self.is_running = True
-        buffer = ""
+        assembler = LineAssembler(self.byte_ns)
+        now = self.clock.now
+        sampled = PROFILER.sampled  # 프로파일링 여부는 루프 진입 전에 한 번만 확인
         
         while self.is_running:
             try:
                 if self.serial_port and self.serial_port.is_open:
-                    if self.serial_port.in_waiting > 0:
-                        data = self.serial_port.read(self.serial_port.in_waiting)
-                        try:
-                            decoded_data = data.decode('utf-8', errors='ignore')
-                            buffer += decoded_data
+                    waiting = self.serial_port.in_waiting
+                    if waiting > 0:
+                        # 도착 시각은 읽기 시점에 기록 (포맷팅은 표시할 때)
+                        arrival_ns = now()
+                        span = sampled("SerialWorker.run")
+                        with span("SerialWorker.run"):
+                            with span("serial.read"):
+                                data = self.serial_port.read(min(waiting, self.read_chunk_size))
                             
-                            # 라인 단위로 처리
-                            while '\n' in buffer:
-                                line, buffer = buffer.split('\n', 1)
-                                line = line.strip()
-                                if line:
-                                    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                                    self.data_received.emit(f"[{timestamp}] RX: {line}")
-                        except UnicodeDecodeError:
-                            # 바이너리 데이터 처리
-                            hex_data = ' '.join(f'{b:02X}' for b in data)
-                            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                            self.data_received.emit(f"[{timestamp}] RX (HEX): {hex_data}")
+                            # 라인 단위로 처리 (바이트 단위로 나눠 멀티바이트 문자가 청크 경계에서 깨지지 않음)
+                            with span("split"):
+                                lines = assembler.feed(data, arrival_ns)
+                            for line_ns, end_ns, raw_line in lines:
+                                try:
+                                    with span("decode"):
+                                        line = raw_line.decode('utf-8', errors='ignore').strip()
+                                    if line:
+                                        # 큐 연결이라 emit 자체는 이벤트 등록뿐이므로
+                                        # 전달 지연은 슬롯에서 "signal.delivery"로 기록
+                                        self.data_received.emit(line_ns, end_ns, f"RX: {line}", span.stamp())
+                                except UnicodeDecodeError:
+                                    # 바이너리 데이터 처리
+                                    hex_data = ' '.join(f'{b:02X}' for b in raw_line)
+                                    self.data_received.emit(line_ns, end_ns, f"RX (HEX): {hex_data}", span.stamp())
+                        
+                        # 남은 데이터가 있으면 대기 없이 바로 이어서 읽음
+                        if self.serial_port.in_waiting > 0:
+                            continue
                             
                     self.msleep(10)  # CPU 사용률 최적화
                 else:
@@ -123,12 +167,75 @@ class SerialWorker(QThread):
         self.wait()
 
 
+class BaudProbeWorker(QThread):
+    """자동 보드레이트 감지를 처리하는 별도 스레드"""
+    finished_probe = Signal(object, float, str)  # (보드레이트 또는 None, 신뢰도, 오류 메시지)
+    
+    def __init__(self, port, preferred=None):
+        super().__init__()
+        self.port = port
+        self.preferred = preferred
+        
+    def run(self):
+        """감지 실행"""
+        try:
+            baudrate, score = probe_baudrate(self.port, preferred=self.preferred)
+            self.finished_probe.emit(baudrate, score, "")
+        except Exception as e:
+            self.finished_probe.emit(None, 0.0, str(e))
+
+
+class ExportWorker(QThread):
+    """캡처 파일 변환을 처리하는 별도 스레드"""
+    finished_export = Signal(bool, str)
+    
+    def __init__(self, sources, output_dir, fmt):
+        super().__init__()
+        self.sources = sources
+        self.output_dir = output_dir
+        self.fmt = fmt
+        
+    def run(self):
+        """변환 실행 (여러 파일이면 프로세스 풀로 병렬 처리)"""
+        try:
+            results = export_captures(self.sources, self.output_dir, self.fmt,
+                                      jobs=min(len(self.sources), os.cpu_count() or 1))
+            self.finished_export.emit(True, "\n".join(format_result(r) for r in results))
+        except Exception as e:
+            self.finished_export.emit(False, f"변환 오류: {str(e)}")
+
+
+class DiffWorker(QThread):
+    """세션 비교를 처리하는 별도 스레드 (수백만 라인 기준 캡처도 GUI가 멈추지 않도록)"""
+    # (성공 여부, 차이 여부, 요약 또는 오류 메시지, 전체 보고서)
+    finished_diff = Signal(bool, bool, str, str)
+    
+    def __init__(self, baseline, lines):
+        super().__init__()
+        self.baseline = baseline
+        self.lines = lines
+        
+    def run(self):
+        """비교 실행 (인덱스 생성, 정렬, 보고서 작성)"""
+        try:
+            diff = SessionDiff(self.baseline, self.lines)
+            report = diff.format_report()
+            self.finished_diff.emit(True, diff.has_differences, report.split("\n\n", 1)[0], report)
+        except Exception as e:
+            self.finished_diff.emit(False, False, f"비교 오류: {str(e)}", "")
+
+
 class MCUSerialApp(QMainWindow):
     """메인 애플리케이션 클래스"""
     
     def __init__(self):
         super().__init__()
         self.serial_worker = SerialWorker()
+        self.export_worker = None
+        self.probe_worker = None
+        self.diff_worker = None
+        self.clock = self.serial_worker.clock
+        self.line_timing = LineTiming()
         self.init_ui()
         self.setup_connections()
         self.refresh_ports()
@@ -145,6 +252,9 @@ class MCUSerialApp(QMainWindow):
         # 메인 레이아웃
         main_layout = QVBoxLayout(central_widget)
         
+        # 메뉴
+        self.create_menu()
+        
         # 연결 설정 그룹
         self.create_connection_group()
         main_layout.addWidget(self.connection_group)
@@ -169,6 +279,20 @@ class MCUSerialApp(QMainWindow):
         # 스타일 설정
         self.setup_styles()
         
+    def create_menu(self):
+        """메뉴바 생성"""
+        file_menu = self.menuBar().addMenu("파일")
+        
+        export_session_action = file_menu.addAction("현재 세션 내보내기...")
+        export_session_action.triggered.connect(self.export_session)
+        
+        convert_action = file_menu.addAction("캡처 파일 변환...")
+        convert_action.triggered.connect(self.convert_captures)
+        
+        file_menu.addSeparator()
+        self.compare_action = file_menu.addAction("기준 캡처와 세션 비교...")
+        self.compare_action.triggered.connect(self.compare_session)
+        
     def create_connection_group(self):
         """연결 설정 UI 생성"""
         self.connection_group = QGroupBox("시리얼 포트 설정")
@@ -187,10 +311,16 @@ class MCUSerialApp(QMainWindow):
         # 보드레이트
         layout.addWidget(QLabel("보드레이트:"), 0, 3)
         self.baudrate_combo = QComboBox()
-        self.baudrate_combo.addItems(['9600', '19200', '38400', '57600', '115200', '230400'])
+        self.baudrate_combo.setEditable(True)  # 사용자 정의 보드레이트 입력 허용
+        self.baudrate_combo.addItems([str(rate) for rate in STANDARD_BAUDRATES])
         self.baudrate_combo.setCurrentText('115200')
+        self.baudrate_combo.setValidator(QIntValidator(MIN_BAUDRATE, MAX_BAUDRATE, self))
         layout.addWidget(self.baudrate_combo, 0, 4)
         
+        self.autobaud_button = QPushButton("자동 감지")
+        self.autobaud_button.clicked.connect(self.detect_baudrate)
+        layout.addWidget(self.autobaud_button, 0, 6)
+        
         # 데이터 비트
         layout.addWidget(QLabel("데이터 비트:"), 1, 0)
         self.databits_combo = QComboBox()
@@ -210,6 +340,17 @@ class MCUSerialApp(QMainWindow):
         self.parity_combo.addItems(['None', 'Even', 'Odd'])
         layout.addWidget(self.parity_combo, 1, 5)
         
+        # 저지연 튜닝
+        self.low_latency_check = QCheckBox("저지연 모드")
+        layout.addWidget(self.low_latency_check, 2, 0)
+        
+        layout.addWidget(QLabel("읽기 크기:"), 2, 1)
+        self.read_chunk_spin = QSpinBox()
+        self.read_chunk_spin.setRange(1, MAX_READ_CHUNK_SIZE)
+        self.read_chunk_spin.setValue(DEFAULT_READ_CHUNK_SIZE)
+        self.read_chunk_spin.setSuffix(" bytes")
+        layout.addWidget(self.read_chunk_spin, 2, 2)
+        
         # 연결/해제 버튼
         self.connect_button = QPushButton("연결")
         self.connect_button.clicked.connect(self.toggle_connection)
@@ -233,6 +374,9 @@ class MCUSerialApp(QMainWindow):
         self.show_timestamp_check.setChecked(True)
         control_layout.addWidget(self.show_timestamp_check)
         
+        self.show_delta_check = QCheckBox("라인 간격 표시")
+        control_layout.addWidget(self.show_delta_check)
+        
         clear_button = QPushButton("지우기")
         clear_button.clicked.connect(self.clear_received_data)
         control_layout.addWidget(clear_button)
@@ -350,7 +494,11 @@ class MCUSerialApp(QMainWindow):
             return
             
         port = self.port_combo.currentData()
-        baudrate = int(self.baudrate_combo.currentText())
+        try:
+            baudrate = parse_baudrate(self.baudrate_combo.currentText())
+        except ValueError as e:
+            QMessageBox.warning(self, "경고", str(e))
+            return
         
         # 데이터 비트 변환
         databits_map = {'7': serial.SEVENBITS, '8': serial.EIGHTBITS}
@@ -364,9 +512,44 @@ class MCUSerialApp(QMainWindow):
         parity_map = {'None': serial.PARITY_NONE, 'Even': serial.PARITY_EVEN, 'Odd': serial.PARITY_ODD}
         parity = parity_map[self.parity_combo.currentText()]
         
-        if self.serial_worker.connect_serial(port, baudrate, databits, stopbits, parity):
+        if self.serial_worker.connect_serial(port, baudrate, databits, stopbits, parity,
+                                             low_latency=self.low_latency_check.isChecked(),
+                                             read_chunk_size=self.read_chunk_spin.value()):
             self.serial_worker.start()
             
+    def detect_baudrate(self):
+        """자동 보드레이트 감지"""
+        if self.port_combo.count() == 0 or not self.port_combo.currentData():
+            QMessageBox.warning(self, "경고", "유효한 포트를 선택하세요.")
+            return
+            
+        try:
+            preferred = parse_baudrate(self.baudrate_combo.currentText())
+        except ValueError:
+            preferred = None
+            
+        # 감지 중에는 같은 포트에 연결하지 못하도록 버튼 비활성화
+        self.autobaud_button.setEnabled(False)
+        self.connect_button.setEnabled(False)
+        self.status_bar.showMessage("보드레이트 감지 중...")
+        
+        self.probe_worker = BaudProbeWorker(self.port_combo.currentData(), preferred)
+        self.probe_worker.finished_probe.connect(self.on_probe_finished)
+        self.probe_worker.start()
+        
+    def on_probe_finished(self, baudrate, score, error):
+        """자동 보드레이트 감지 완료 처리"""
+        self.autobaud_button.setEnabled(True)
+        self.connect_button.setEnabled(True)
+        
+        if error:
+            self.status_bar.showMessage(f"감지 오류: {error}")
+        elif baudrate:
+            self.baudrate_combo.setCurrentText(str(baudrate))
+            self.status_bar.showMessage(f"감지된 보드레이트: {baudrate} (신뢰도 {score:.0%})")
+        else:
+            self.status_bar.showMessage("수신 데이터가 없어 보드레이트를 감지하지 못했습니다.")
+            
     def disconnect_serial(self):
         """시리얼 포트 연결 해제"""
         self.serial_worker.stop()
@@ -385,6 +568,9 @@ class MCUSerialApp(QMainWindow):
             self.stopbits_combo.setEnabled(False)
             self.parity_combo.setEnabled(False)
             self.refresh_button.setEnabled(False)
+            self.autobaud_button.setEnabled(False)
+            self.low_latency_check.setEnabled(False)
+            self.read_chunk_spin.setEnabled(False)
         else:
             self.connect_button.setText("연결")
             self.connect_button.setStyleSheet("background-color: #44aa44")
@@ -397,17 +583,37 @@ class MCUSerialApp(QMainWindow):
             self.stopbits_combo.setEnabled(True)
             self.parity_combo.setEnabled(True)
             self.refresh_button.setEnabled(True)
+            self.autobaud_button.setEnabled(True)
+            self.low_latency_check.setEnabled(True)
+            self.read_chunk_spin.setEnabled(True)
             
         self.status_bar.showMessage(message)
         
-    def on_data_received(self, data):
+    def on_data_received(self, arrival_ns, end_ns, data, emit_ns=None):
         """데이터 수신 처리"""
-        cursor = self.received_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertText(data + "\n")
-        
-        if self.auto_scroll_check.isChecked():
-            self.received_text.ensureCursorVisible()
+        if emit_ns is not None:
+            # emit부터 슬롯 실행까지 Qt 이벤트 큐에서 대기한 시간
+            PROFILER.record("signal.delivery", emit_ns)
+        span = PROFILER.sampled("on_data_received")
+        with span("on_data_received"):
+            response_ns = self.line_timing.response_ns(arrival_ns, end_ns)
+            delta_ns = self.line_timing.line_delta_ns(arrival_ns)
+            if response_ns is not None:
+                self.status_bar.showMessage(f"응답 시간: {response_ns / 1_000_000:.3f} ms")
+            
+            if self.show_timestamp_check.isChecked():
+                with span("timestamp"):
+                    delta = format_delta(delta_ns) if self.show_delta_check.isChecked() else ""
+                    data = f"[{self.clock.format(arrival_ns)}{delta}] {data}"
+            
+            with span("QTextEdit.insert"):
+                cursor = self.received_text.textCursor()
+                cursor.movePosition(QTextCursor.End)
+                cursor.insertText(data + "\n")
+            
+            if self.auto_scroll_check.isChecked():
+                with span("QTextEdit.scroll"):
+                    self.received_text.ensureCursorVisible()
             
     def send_data(self):
         """데이터 전송"""
@@ -432,10 +638,20 @@ class MCUSerialApp(QMainWindow):
             if self.add_newline_check.isChecked():
                 data += "\n"
                 
+        # 송신 시각은 write() 전에 기록 (빠른 MCU의 응답이 송신 시각보다 앞서지 않도록)
+        tx_ns = self.clock.now()
         if self.serial_worker.send_data(data):
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            tx_data = repr(data)[1:-1]  # 문자열 표현에서 따옴표 제거
-            self.received_text.append(f"[{timestamp}] TX: {tx_data}")
+            self.line_timing.mark_tx(tx_ns)
+            span = PROFILER.sampled("send_data")
+            with span("send_data"):
+                tx_data = repr(data)[1:-1]  # 문자열 표현에서 따옴표 제거
+                if self.show_timestamp_check.isChecked():
+                    with span("timestamp"):
+                        tx_data = f"[{self.clock.format(tx_ns)}] TX: {tx_data}"
+                else:
+                    tx_data = f"TX: {tx_data}"
+                with span("QTextEdit.append"):
+                    self.received_text.append(tx_data)
             self.send_line.clear()
             
     def send_quick_command(self, command):
@@ -450,17 +666,115 @@ class MCUSerialApp(QMainWindow):
                 self.send_line.setText(text)
                 self.send_data()
                 
+    def _select_export_format(self):
+        """내보내기 포맷 선택"""
+        fmt, ok = QInputDialog.getItem(self, "내보내기 포맷", "포맷:", list(FORMATS), 0, False)
+        return fmt if ok else None
+        
+    def export_session(self):
+        """현재 세션(수신 데이터 창) 내보내기"""
+        fmt = self._select_export_format()
+        if not fmt:
+            return
+            
+        path, _ = QFileDialog.getSaveFileName(
+            self, "세션 내보내기", "session" + FORMAT_EXTENSIONS[fmt],
+            f"{fmt.upper()} (*{FORMAT_EXTENSIONS[fmt]})"
+        )
+        if not path:
+            return
+            
+        try:
+            lines = self.received_text.toPlainText().splitlines()
+            records = export_lines(lines, path, fmt)
+            self.status_bar.showMessage(f"내보내기 완료: {path} ({records} 레코드)")
+        except Exception as e:
+            QMessageBox.warning(self, "오류", f"내보내기 오류: {str(e)}")
+            
+    def convert_captures(self):
+        """녹화된 캡처 파일 변환"""
+        if self.export_worker and self.export_worker.isRunning():
+            QMessageBox.information(self, "알림", "이미 변환 중입니다.")
+            return
+            
+        sources, _ = QFileDialog.getOpenFileNames(
+            self, "캡처 파일 선택", "", "캡처 로그 (*.log *.txt);;모든 파일 (*)"
+        )
+        if not sources:
+            return
+            
+        fmt = self._select_export_format()
+        if not fmt:
+            return
+            
+        output_dir = QFileDialog.getExistingDirectory(self, "출력 디렉터리 선택")
+        if not output_dir:
+            return
+            
+        self.export_worker = ExportWorker(sources, output_dir, fmt)
+        self.export_worker.finished_export.connect(self.on_export_finished)
+        self.export_worker.start()
+        self.status_bar.showMessage(f"변환 중: {len(sources)}개 파일 -> {fmt}")
+        
+    def on_export_finished(self, success, message):
+        """캡처 변환 완료 처리"""
+        if success:
+            self.status_bar.showMessage("변환 완료")
+            QMessageBox.information(self, "변환 완료", message)
+        else:
+            self.status_bar.showMessage(message)
+            QMessageBox.warning(self, "오류", message)
+            
+    def compare_session(self):
+        """기준 캡처 파일과 현재 세션 비교 (내용 변경 + 응답 시간 회귀)"""
+        baseline, _ = QFileDialog.getOpenFileName(
+            self, "기준 캡처 선택", "", "캡처 로그 (*.log *.txt);;모든 파일 (*)"
+        )
+        if not baseline:
+            return
+            
+        # 현재 세션 내용은 GUI 스레드에서 복사해 넘김 (비교 중 수신되는 라인은 제외)
+        lines = self.received_text.toPlainText().splitlines()
+        self.compare_action.setEnabled(False)
+        self.diff_worker = DiffWorker(baseline, lines)
+        self.diff_worker.finished_diff.connect(self.on_diff_finished)
+        self.diff_worker.start()
+        self.status_bar.showMessage(f"세션 비교 중: {os.path.basename(baseline)}")
+        
+    def on_diff_finished(self, success, has_differences, summary, report):
+        """세션 비교 완료 처리"""
+        self.compare_action.setEnabled(True)
+        if not success:
+            self.status_bar.showMessage(summary)
+            QMessageBox.warning(self, "오류", summary)
+            return
+            
+        self.status_bar.showMessage("세션 비교 완료")
+        box = QMessageBox(self)
+        box.setWindowTitle("세션 비교")
+        box.setIcon(QMessageBox.Warning if has_differences else QMessageBox.Information)
+        box.setText(summary if has_differences else summary + "\n\n차이가 없습니다.")
+        box.setDetailedText(report)
+        box.exec()
+        
     def clear_received_data(self):
         """수신 데이터 지우기"""
         self.received_text.clear()
         
     def closeEvent(self, event):
         """프로그램 종료 시 정리"""
+        if self.probe_worker and self.probe_worker.isRunning():
+            self.probe_worker.wait()
+        if self.diff_worker and self.diff_worker.isRunning():
+            self.diff_worker.wait()
         self.serial_worker.stop()
         event.accept()
 
 
 def main():
+    # --profile-trace [PATH.json]: 핫패스 프로파일링 (종료 시 trace 저장)
+    sys.argv = init_profile_trace(sys.argv)
+    
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # 모던한 스타일
     
@@ -8,8 +8,20 @@ import serial
 import serial.tools.list_ports
 import threading
 import time
+import re
 import sys
-from datetime import datetime
+import argparse
+
+from serial_link import (
+    STANDARD_BAUDRATES, DEFAULT_READ_CHUNK_SIZE,
+    parse_baudrate, parse_read_chunk_size, probe_baudrate, apply_low_latency, restore_low_latency
+)
+from capture_export import (
+    FORMATS, DEFAULT_BATCH_SIZE, export_captures, format_result, throughput_mb_s
+)
+from hotpath_profiler import PROFILER, init_profile_trace
+from timestamp_engine import ArrivalClock, LineAssembler, LineTiming, byte_time_ns, format_delta
+from session_diff import DEFAULT_MASKS, DEFAULT_LATENCY_THRESHOLD_MS, SessionDiff
 
 
 class MCUSerialConsole:
@@ -17,6 +29,14 @@ class MCUSerialConsole:
         self.serial_port = None
         self.is_running = False
         self.read_thread = None
+        self.read_chunk_size = DEFAULT_READ_CHUNK_SIZE
+        self.capture_file = None
+        # 수신 스레드(_output)와 메인 스레드(record 명령)가 함께 사용
+        self.capture_lock = threading.Lock()
+        self.clock = ArrivalClock()
+        self.line_timing = LineTiming()
+        self.show_delta = False
+        self.byte_ns = byte_time_ns(115200)
         
     def list_ports(self):
         """사용 가능한 시리얼 포트 목록 출력"""
@@ -32,7 +52,8 @@ class MCUSerialConsole:
             
         return ports
     
-    def connect(self, port, baudrate=115200, databits=8, stopbits=1, parity='N'):
+    def connect(self, port, baudrate=115200, databits=8, stopbits=1, parity='N',
+                low_latency=False, read_chunk_size=DEFAULT_READ_CHUNK_SIZE):
         """시리얼 포트 연결"""
         try:
             if self.serial_port and self.serial_port.is_open:
@@ -55,6 +76,12 @@ class MCUSerialConsole:
             
             if self.serial_port.is_open:
                 print(f"✅ 연결됨: {port} (보드레이트: {baudrate})")
+                if low_latency:
+                    applied = apply_low_latency(self.serial_port)
+                    print(f"⚡ 저지연 설정: {', '.join(applied) if applied else '지원되지 않음'}")
+                self.read_chunk_size = read_chunk_size
+                self.byte_ns = byte_time_ns(baudrate, databits, parity, stopbits)
+                self.clock.anchor()
                 self.start_reading()
                 return True
             else:
@@ -73,6 +100,7 @@ class MCUSerialConsole:
             self.read_thread.join(timeout=2)
             
         if self.serial_port and self.serial_port.is_open:
+            restore_low_latency(self.serial_port)
             self.serial_port.close()
             print("🔌 연결 해제됨")
     
@@ -84,29 +112,49 @@ class MCUSerialConsole:
     
     def _read_data(self):
         """데이터 읽기 스레드 함수"""
-        buffer = ""
+        assembler = LineAssembler(self.byte_ns)
+        now = self.clock.now
+        sampled = PROFILER.sampled  # 프로파일링 여부는 루프 진입 전에 한 번만 확인
         
         while self.is_running and self.serial_port and self.serial_port.is_open:
             try:
-                if self.serial_port.in_waiting > 0:
-                    data = self.serial_port.read(self.serial_port.in_waiting)
-                    try:
-                        decoded_data = data.decode('utf-8', errors='ignore')
-                        buffer += decoded_data
+                waiting = self.serial_port.in_waiting
+                if waiting > 0:
+                    # 도착 시각은 읽기 시점에 기록 (포맷팅은 출력할 때)
+                    arrival_ns = now()
+                    span = sampled("_read_data")
+                    with span("_read_data"):
+                        with span("serial.read"):
+                            data = self.serial_port.read(min(waiting, self.read_chunk_size))
                         
-                        # 라인 단위로 처리
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            line = line.strip()
-                            if line:
-                                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                                print(f"[{timestamp}] RX: {line}")
-                                
-                    except UnicodeDecodeError:
-                        # 바이너리 데이터 처리
-                        hex_data = ' '.join(f'{b:02X}' for b in data)
-                        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                        print(f"[{timestamp}] RX (HEX): {hex_data}")
+                        # 라인 단위로 처리 (바이트 단위로 나눠 멀티바이트 문자가 청크 경계에서 깨지지 않음)
+                        with span("split"):
+                            lines = assembler.feed(data, arrival_ns)
+                        for line_ns, end_ns, raw_line in lines:
+                            try:
+                                with span("decode"):
+                                    line = raw_line.decode('utf-8', errors='ignore').strip()
+                                if line:
+                                    response_ns = self.line_timing.response_ns(line_ns, end_ns)
+                                    delta_ns = self.line_timing.line_delta_ns(line_ns)
+                                    with span("timestamp"):
+                                        timestamp = self.clock.format(line_ns)
+                                        if self.show_delta:
+                                            timestamp += format_delta(delta_ns)
+                                    with span("output"):
+                                        self._output(f"[{timestamp}] RX: {line}")
+                                    if response_ns is not None:
+                                        # 응답 시간은 화면에만 표시 (캡처 파일에는 기록하지 않음)
+                                        print(f"   ⏱️ 응답 시간: {response_ns / 1_000_000:.3f} ms")
+                                    
+                            except UnicodeDecodeError:
+                                # 바이너리 데이터 처리
+                                hex_data = ' '.join(f'{b:02X}' for b in raw_line)
+                                self._output(f"[{self.clock.format(line_ns)}] RX (HEX): {hex_data}")
+                    
+                    # 남은 데이터가 있으면 대기 없이 바로 이어서 읽음
+                    if self.serial_port.in_waiting > 0:
+                        continue
                         
                 time.sleep(0.01)  # CPU 사용률 최적화
                 
@@ -124,17 +172,80 @@ class MCUSerialConsole:
             if add_newline and not data.endswith('\n'):
                 data += '\n'
                 
-            self.serial_port.write(data.encode('utf-8'))
-            self.serial_port.flush()
-            
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            print(f"[{timestamp}] TX: {repr(data)[1:-1]}")
+            span = PROFILER.sampled("send_data")
+            with span("send_data"):
+                with span("encode"):
+                    payload = data.encode('utf-8')
+                # 송신 시각은 write() 전에 기록 (빠른 MCU의 응답이 송신 시각보다 앞서지 않도록)
+                tx_ns = self.clock.now()
+                self.line_timing.mark_tx(tx_ns)
+                with span("serial.write"):
+                    self.serial_port.write(payload)
+                with span("serial.flush"):
+                    self.serial_port.flush()
+                
+                with span("timestamp"):
+                    timestamp = self.clock.format(tx_ns)
+                with span("output"):
+                    self._output(f"[{timestamp}] TX: {repr(data)[1:-1]}")
             return True
             
         except Exception as e:
             print(f"❌ 전송 오류: {e}")
             return False
     
+    def _output(self, line):
+        """송수신 라인 출력 (녹화 중이면 캡처 파일에도 기록)"""
+        print(line)
+        with self.capture_lock:
+            capture_file = self.capture_file
+            if not capture_file:
+                return
+            try:
+                capture_file.write(line + "\n")
+            except (OSError, ValueError) as e:
+                # 녹화 오류로 수신이 중단되지 않도록 녹화만 중지
+                self.capture_file = None
+                print(f"❌ 녹화 오류: {e} - 녹화를 중지합니다")
+    
+    def start_recording(self, path):
+        """세션 녹화 시작"""
+        self.stop_recording()
+        try:
+            capture_file = open(path, 'a', encoding='utf-8', buffering=1)
+        except OSError as e:
+            print(f"❌ 녹화 오류: {e}")
+            return
+        with self.capture_lock:
+            self.capture_file = capture_file
+        print(f"⏺️ 녹화 시작: {path}")
+    
+    def stop_recording(self):
+        """세션 녹화 중지"""
+        with self.capture_lock:
+            capture_file, self.capture_file = self.capture_file, None
+            if capture_file:
+                capture_file.close()
+        if capture_file:
+            print(f"⏹️ 녹화 중지: {capture_file.name}")
+    
+    def detect_baudrate(self, port, preferred=None):
+        """자동 보드레이트 감지"""
+        print(f"🔍 보드레이트 감지 중: {port}")
+        started = time.monotonic()
+        try:
+            baudrate, score = probe_baudrate(port, preferred=preferred)
+        except Exception as e:
+            print(f"❌ 감지 오류: {e}")
+            return None
+            
+        elapsed_ms = (time.monotonic() - started) * 1000
+        if baudrate:
+            print(f"✅ 감지된 보드레이트: {baudrate} (신뢰도 {score:.0%}, {elapsed_ms:.0f}ms)")
+        else:
+            print("❌ 수신 데이터가 없어 보드레이트를 감지하지 못했습니다.")
+        return baudrate
+    
     def interactive_mode(self):
         """대화형 모드"""
         print("\n=== MCU RS232 통신 프로그램 ===")
@@ -142,12 +253,15 @@ class MCUSerialConsole:
         print("  list    - 포트 목록 보기")
         print("  connect - 포트 연결")
         print("  send    - 데이터 전송")
+        print("  record  - 세션 녹화 (record FILE / record off)")
+        print("  delta   - 라인 간격 표시 (delta on / delta off)")
         print("  quit    - 종료")
         print("  help    - 도움말")
         
         while True:
             try:
-                command = input("\n> ").strip().lower()
+                raw_command = input("\n> ").strip()
+                command = raw_command.lower()
                 
                 if command == 'quit' or command == 'exit':
                     break
@@ -159,6 +273,13 @@ class MCUSerialConsole:
                     self._send_interactive()
                 elif command == 'help':
                     self._show_help()
+                elif command in ('delta on', 'delta off'):
+                    self.show_delta = command == 'delta on'
+                    print(f"라인 간격 표시: {'켜짐' if self.show_delta else '꺼짐'}")
+                elif command == 'record off':
+                    self.stop_recording()
+                elif command.startswith('record '):
+                    self.start_recording(raw_command[7:].strip())  # 파일 경로는 대소문자 유지
                 elif command.startswith('send '):
                     # 빠른 전송: "send AT" 형식
                     data = command[5:]
@@ -175,6 +296,7 @@ class MCUSerialConsole:
                 break
         
         self.disconnect()
+        self.stop_recording()
         print("프로그램을 종료합니다.")
     
     def _connect_interactive(self):
@@ -190,17 +312,27 @@ class MCUSerialConsole:
             if 0 <= port_index < len(ports):
                 selected_port = ports[port_index].device
                 
-                # 보드레이트 선택
-                baudrate = input("보드레이트 [115200]: ").strip()
+                # 보드레이트 선택 (임의 값 또는 'auto')
+                print("일반 보드레이트: " + ", ".join(str(rate) for rate in STANDARD_BAUDRATES))
+                baudrate = input("보드레이트 [115200, auto=자동 감지]: ").strip().lower()
                 if not baudrate:
                     baudrate = "115200"
                     
-                self.connect(selected_port, int(baudrate))
+                if baudrate == 'auto':
+                    baudrate = self.detect_baudrate(selected_port)
+                    if not baudrate:
+                        return
+                        
+                low_latency = input("저지연 모드 사용? (y/N): ").strip().lower() == 'y'
+                read_chunk_size = input(f"읽기 청크 크기 [{DEFAULT_READ_CHUNK_SIZE} bytes]: ").strip()
+                read_chunk_size = parse_read_chunk_size(read_chunk_size or DEFAULT_READ_CHUNK_SIZE)
+                self.connect(selected_port, parse_baudrate(baudrate), low_latency=low_latency,
+                             read_chunk_size=read_chunk_size)
             else:
                 print("잘못된 선택입니다.")
                 
-        except ValueError:
-            print("올바른 숫자를 입력하세요.")
+        except ValueError as e:
+            print(f"올바른 숫자를 입력하세요. ({e})")
         except Exception as e:
             print(f"연결 오류: {e}")
     
@@ -226,10 +358,79 @@ class MCUSerialConsole:
         print("  list           - 사용 가능한 포트 목록")
         print("  connect        - 시리얼 포트 연결")
         print("  send           - 데이터 전송 (대화형)")
+        print("  record FILE    - 송수신 로그를 캡처 파일로 녹화")
+        print("  record off     - 녹화 중지")
+        print("  delta on/off   - 수신 라인 타임스탬프에 직전 라인과의 간격 표시")
         print("  quit/exit      - 프로그램 종료")
+        print("\n명령행 옵션:")
+        print("  --autobaud PORT  - 보드레이트 자동 감지")
+        print("  export FILES...  - 캡처 파일을 CSV/JSONL/Parquet/Arrow로 변환")
+        print("  diff BASE NEW    - 두 캡처 비교 (내용 변경 + 응답 시간 회귀)")
+        print("  --profile-trace [PATH.json]  - 핫패스 프로파일링 (--profile-sample N: N개 중 1개 측정)")
+
+
+def export_main(args):
+    """export 서브커맨드: 캡처 파일 스트리밍 변환"""
+    parser = argparse.ArgumentParser(
+        prog="mcu_serial_console.py export",
+        description="캡처 파일을 CSV/JSONL/Parquet/Arrow로 변환"
+    )
+    parser.add_argument('files', nargs='+', help="변환할 캡처 파일")
+    parser.add_argument('-f', '--format', choices=FORMATS, default='csv', help="출력 포맷")
+    parser.add_argument('-o', '--output-dir', help="출력 디렉터리 (기본: 원본과 같은 위치)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="병렬 변환 프로세스 수")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="배치당 레코드 수")
+    options = parser.parse_args(args)
+    
+    started = time.perf_counter()
+    try:
+        results = export_captures(options.files, options.output_dir, options.format,
+                                  options.jobs, options.batch_size)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"❌ 변환 오류: {e}")
+        return 1
+    elapsed = time.perf_counter() - started
+    
+    for result in results:
+        print(f"✅ {format_result(result)}")
+    total_bytes = sum(result.bytes_in for result in results)
+    print(f"합계: {len(results)}개 파일, {sum(result.records for result in results)} 레코드, "
+          f"{throughput_mb_s(total_bytes, elapsed):.1f} MB/s")
+    return 0
+
+
+def diff_main(args):
+    """diff 서브커맨드: 두 캡처 비교 (차이나 응답 시간 회귀가 있으면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(
+        prog="mcu_serial_console.py diff",
+        description="두 캡처를 비교해 변경 라인과 응답 시간 회귀를 보고"
+    )
+    parser.add_argument('baseline', help="기준 캡처 파일 (이전 펌웨어)")
+    parser.add_argument('candidate', help="비교 캡처 파일 (새 펌웨어)")
+    parser.add_argument('-m', '--mask', action='append', default=[],
+                        help="비교에서 무시할 변동 필드 정규식 (여러 번 지정 가능)")
+    parser.add_argument('--no-default-masks', action='store_true',
+                        help=f"기본 마스크 사용 안 함 ({', '.join(DEFAULT_MASKS)})")
+    parser.add_argument('-t', '--latency-threshold', type=float, default=DEFAULT_LATENCY_THRESHOLD_MS,
+                        help="응답 시간 회귀로 볼 증가량 (ms)")
+    parser.add_argument('--max-hunks', type=int, default=20, help="출력할 최대 차이 구간 수")
+    options = parser.parse_args(args)
+    
+    masks = options.mask + ([] if options.no_default_masks else DEFAULT_MASKS)
+    try:
+        diff = SessionDiff(options.baseline, options.candidate, masks, options.latency_threshold)
+    except (OSError, re.error) as e:
+        print(f"❌ 비교 오류: {e}")
+        return 2
+    
+    print(diff.format_report(max_hunks=options.max_hunks))
+    return 1 if diff.has_differences else 0
 
 
 def main():
+    # --profile-trace [PATH.json]: 핫패스 프로파일링 (종료 시 trace 저장)
+    sys.argv = init_profile_trace(sys.argv)
+    
     console = MCUSerialConsole()
     
     # 명령행 인수 처리
@@ -237,6 +438,17 @@ def main():
         if sys.argv[1] == '--list':
             console.list_ports()
             return
+        elif sys.argv[1] == 'export':
+            sys.exit(export_main(sys.argv[2:]))
+        elif sys.argv[1] == 'diff':
+            sys.exit(diff_main(sys.argv[2:]))
+        elif sys.argv[1] == '--autobaud':
+            # 보드레이트 자동 감지 모드
+            if len(sys.argv) < 3:
+                print("사용법: mcu_serial_console.py --autobaud PORT")
+                return
+            console.detect_baudrate(sys.argv[2])
+            return
         elif sys.argv[1] == '--test':
             # 자동 테스트 모드
             ports = console.list_ports()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+시리얼 링크 설정 유틸리티
+고속/사용자 정의 보드레이트 검증, 자동 보드레이트 감지, 저지연 튜닝
+"""
+
+import os
+import time
+import serial
+
+
+# GUI/콘솔에 기본으로 제공하는 보드레이트 (FTDI/CP210x 고속 포함)
+STANDARD_BAUDRATES = [
+    9600, 19200, 38400, 57600, 115200, 230400,
+    460800, 921600, 1000000, 1500000, 2000000,
+]
+
+# 자동 감지 시도 순서: 가장 흔한 속도를 먼저 시도해 조기 종료 확률을 높임
+AUTOBAUD_CANDIDATES = [
+    115200, 9600, 921600, 460800, 230400, 57600,
+    38400, 19200, 2000000, 1000000, 1500000,
+]
+
+MIN_BAUDRATE = 50
+MAX_BAUDRATE = 12000000
+
+DEFAULT_READ_CHUNK_SIZE = 4096
+MAX_READ_CHUNK_SIZE = 65536
+
+# 저지연 모드에서 변경한 FTDI latency_timer 원래 값 (sysfs 경로 -> 값), 연결 해제 시 복원
+_saved_latency_timers = {}
+# ASYNC_LOW_LATENCY 플래그를 켠 포트 (연결 해제 시 해제)
+_low_latency_ports = set()
+
+# 정상 텍스트로 간주하는 바이트 (출력 가능 ASCII + 탭/개행)
+_TEXT_BYTES = bytes(range(0x20, 0x7F)) + b'\t\r\n'
+# UTF-8로 올바르게 디코딩되는 경우 멀티바이트 문자도 정상으로 간주
+_UTF8_BYTES = _TEXT_BYTES + bytes(b for b in range(0x80, 0xF5) if b not in (0xC0, 0xC1))
+
+
+def parse_baudrate(text):
+    """보드레이트 문자열 검증 및 변환 (범위 밖이면 ValueError)"""
+    try:
+        baudrate = int(str(text).strip())
+    except ValueError:
+        raise ValueError(f"유효하지 않은 보드레이트: {text}")
+
+    if not MIN_BAUDRATE <= baudrate <= MAX_BAUDRATE:
+        raise ValueError(f"보드레이트 범위 초과 ({MIN_BAUDRATE}~{MAX_BAUDRATE}): {baudrate}")
+    return baudrate
+
+
+def parse_read_chunk_size(text):
+    """읽기 청크 크기 문자열 검증 및 변환 (범위 밖이면 ValueError)"""
+    try:
+        size = int(str(text).strip())
+    except ValueError:
+        raise ValueError(f"유효하지 않은 읽기 청크 크기: {text}")
+
+    if not 1 <= size <= MAX_READ_CHUNK_SIZE:
+        raise ValueError(f"읽기 청크 크기 범위 초과 (1~{MAX_READ_CHUNK_SIZE}): {size}")
+    return size
+
+
+def score_framing(data):
+    """수신 바이트의 프레이밍 유효성 점수 (0.0~1.0)
+
+    보드레이트가 틀리면 0x00/0xFF/제어 문자와 깨진 UTF-8이 섞여 들어오므로
+    정상 텍스트 바이트의 비율로 점수를 매긴다.
+    """
+    if not data:
+        return 0.0
+
+    allowed = _TEXT_BYTES
+    # 끝부분에서 잘린 멀티바이트 문자는 무시하고 UTF-8 유효성 확인
+    for trim in range(4):
+        try:
+            data[:len(data) - trim].decode('utf-8')
+            allowed = _UTF8_BYTES
+            break
+        except UnicodeDecodeError:
+            continue
+
+    bad = len(data.translate(None, allowed))
+    return 1.0 - bad / len(data)
+
+
+def order_candidates(candidates=None, preferred=None):
+    """시도 순서 정렬: 마지막으로 사용한 보드레이트를 맨 앞에 배치"""
+    ordered = list(candidates or AUTOBAUD_CANDIDATES)
+    if preferred in ordered:
+        ordered.remove(preferred)
+    if preferred:
+        ordered.insert(0, preferred)
+    return ordered
+
+
+def probe_baudrate(port, candidates=None, preferred=None, probe_data=None,
+                   dwell=0.06, min_bytes=32, accept_score=0.97,
+                   bytesize=serial.EIGHTBITS, stopbits=serial.STOPBITS_ONE,
+                   parity=serial.PARITY_NONE):
+    """자동 보드레이트 감지
+
+    포트를 한 번만 열고 보드레이트만 바꿔가며 후보별로 짧게(dwell 초) 수신한 뒤
+    프레이밍 점수가 가장 높은 보드레이트를 반환한다. min_bytes 이상 받고
+    accept_score 이상이면 그 보드레이트를 즉시 반환하므로 보통 수백 ms 안에 끝난다.
+    min_bytes보다 짧은 샘플은 우연히 출력 가능한 문자만 들어와도 점수가 높으므로
+    충분한 샘플보다 우선하지 않는다.
+
+    반환: (baudrate, score) - 아무 데이터도 받지 못하면 (None, 0.0)
+    """
+    ordered = order_candidates(candidates, preferred)
+    best_baudrate, best_score, best_rank = None, 0.0, None
+
+    with serial.Serial(port=port, baudrate=ordered[0], bytesize=bytesize,
+                       stopbits=stopbits, parity=parity, timeout=0) as ser:
+        for baudrate in ordered:
+            # 포트를 다시 열지 않고 속도만 재설정
+            ser.baudrate = baudrate
+            ser.reset_input_buffer()
+            if probe_data:
+                ser.write(probe_data)
+                ser.flush()
+
+            data = bytearray()
+            deadline = time.monotonic() + dwell
+            while len(data) < min_bytes and time.monotonic() < deadline:
+                chunk = ser.read(ser.in_waiting or 1)
+                if chunk:
+                    data += chunk
+                else:
+                    time.sleep(0.002)
+
+            if not data:
+                continue
+
+            score = score_framing(bytes(data))
+            if score >= accept_score and len(data) >= min_bytes:
+                return baudrate, score
+
+            rank = (len(data) >= min_bytes, score, len(data))
+            if best_rank is None or rank > best_rank:
+                best_baudrate, best_score, best_rank = baudrate, score, rank
+
+    return best_baudrate, best_score
+
+
+def _ftdi_latency_timer_path(port):
+    """FTDI 계열 USB-Serial의 latency_timer sysfs 경로 (Linux)"""
+    name = os.path.basename(os.path.realpath(port))
+    return f"/sys/bus/usb-serial/devices/{name}/latency_timer"
+
+
+def apply_low_latency(serial_port, latency_timer_ms=1):
+    """저지연 모드 적용 (지원되는 경우만)
+
+    - Linux: ASYNC_LOW_LATENCY 플래그 및 FTDI latency_timer(기본 16ms) 조정
+    - Windows: 드라이버 수신 버퍼 확대
+    반환: 적용된 항목 설명 리스트
+    """
+    applied = []
+
+    if hasattr(serial_port, 'set_low_latency_mode'):
+        try:
+            serial_port.set_low_latency_mode(True)
+            _low_latency_ports.add(serial_port.port)
+            applied.append("low_latency")
+        except (OSError, ValueError, serial.SerialException):
+            pass
+
+    timer_path = _ftdi_latency_timer_path(serial_port.port or "")
+    if os.path.exists(timer_path):
+        try:
+            with open(timer_path) as f:
+                original = f.read().strip()
+            with open(timer_path, 'w') as f:
+                f.write(str(latency_timer_ms))
+            # 이미 저장된 값이 있으면 (재적용) 최초 값을 유지
+            _saved_latency_timers.setdefault(timer_path, original)
+            applied.append(f"latency_timer={latency_timer_ms}ms")
+        except OSError:
+            # 권한이 없으면 (udev 규칙 미설정) 건너뜀
+            pass
+
+    if hasattr(serial_port, 'set_buffer_size'):
+        try:
+            serial_port.set_buffer_size(rx_size=65536)
+            applied.append("rx_buffer=65536")
+        except (OSError, ValueError, serial.SerialException):
+            pass
+
+    return applied
+
+
+def restore_low_latency(serial_port):
+    """apply_low_latency()로 변경한 설정 복원 (포트를 닫기 전에 호출)
+
+    ASYNC_LOW_LATENCY 플래그를 해제하고 FTDI latency_timer를 원래 값으로 되돌린다.
+    반환: 복원한 항목이 있으면 True
+    """
+    restored = False
+
+    if serial_port.port in _low_latency_ports:
+        _low_latency_ports.discard(serial_port.port)
+        try:
+            serial_port.set_low_latency_mode(False)
+            restored = True
+        except (OSError, ValueError, serial.SerialException):
+            pass
+
+    timer_path = _ftdi_latency_timer_path(serial_port.port or "")
+    original = _saved_latency_timers.pop(timer_path, None)
+    if original is not None:
+        try:
+            with open(timer_path, 'w') as f:
+                f.write(original)
+            restored = True
+        except OSError:
+            pass
+
+    return restored
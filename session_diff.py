@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+세션 비교 (회귀 검사)
+두 캡처(녹화 파일 또는 현재 세션)를 정렬해 추가/삭제/변경 라인과
+대응되는 응답 라인의 응답 시간 차이를 보고
+
+- 타임스탬프/카운터 같은 변동 필드는 정규식 마스크로 가린 뒤 비교
+- 라인은 해시(int64) 배열로만 보관하고 Myers 선형 공간 diff(middle snake 분할)로 정렬
+- 편집 거리가 큰 구간은 양쪽에 한 번씩만 나오는 라인(patience 방식)이나 절반 위치에서 나눠 계속 정렬
+- 보고서에 필요한 라인 원문은 두 번째 순차 읽기에서만 가져옴
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter, namedtuple
+
+from capture_export import parse_capture_line
+
+
+# 기본 마스크: 데이터 안에 포함된 시각 (예: "uptime 12:34:56.789")
+DEFAULT_MASKS = [r'\d{1,2}:\d{2}:\d{2}(?:\.\d+)?']
+MASK_TOKEN = '<*>'
+
+DEFAULT_LATENCY_THRESHOLD_MS = 5.0
+# 한 구간의 Myers 탐색 편집 거리 상한 (최악의 O(ND) 방지)
+# 넘으면 구간을 나눠서 계속 정렬하며, 이 상한 안에 드는 작은 구간은 항상 정확히 정렬됨
+DEFAULT_MAX_EDIT_DISTANCE = 4000
+# 상한보다 큰 구간은 이 편집 거리까지만 먼저 탐색해 보고, 넘으면 바로 분할
+_PROBE_EDIT_DISTANCE = 64
+# 구간을 반으로 나눌 때 추정 위치 주변에서 같은 라인을 찾는 범위
+_SPLIT_SEARCH = 64
+
+_DAY_MS = 24 * 60 * 60 * 1000
+
+Hunk = namedtuple('Hunk', 'a_start a_end b_start b_end')
+LatencyDelta = namedtuple('LatencyDelta', 'a_index b_index a_ms b_ms delta_ms')
+
+
+def compile_masks(patterns):
+    """마스크 정규식 목록을 하나의 패턴으로 결합"""
+    patterns = list(patterns or [])
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+def open_lines(source):
+    """라인 이터레이터 생성: 파일 경로 또는 라인 리스트(현재 세션)"""
+    if isinstance(source, str):
+        return open(source, 'r', encoding='utf-8', errors='replace')
+    return iter(source)
+
+
+def _timestamp_ms(timestamp):
+    """"HH:MM:SS.mmm" -> 자정 기준 ms"""
+    hours, minutes, seconds = timestamp.split(':')
+    return (int(hours) * 3600 + int(minutes) * 60) * 1000 + round(float(seconds) * 1000)
+
+
+class SessionIndex:
+    """세션 한 개의 비교용 인덱스 (라인당 int64 3개)
+
+    keys: 마스크 적용 후 (방향, 데이터) 해시
+    latency_ms: 송신(TX) 후 첫 수신 라인의 응답 시간 (응답 라인이 아니면 -1)
+    """
+
+    def __init__(self, source, masks=None):
+        self.source = source
+        self.line_numbers = array('q')
+        self.keys = array('q')
+        self.latency_ms = array('q')
+        self._build(masks)
+
+    def _build(self, masks):
+        last_tx_ms = None
+        previous_ms = None
+        day_offset = 0
+
+        lines = open_lines(self.source)
+        try:
+            for line_no, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                _, timestamp, direction, data = parse_capture_line(line_no, line)
+                if masks is not None:
+                    data = masks.sub(MASK_TOKEN, data)
+
+                self.line_numbers.append(line_no)
+                self.keys.append(hash((direction, data)))
+
+                latency = -1
+                if timestamp:
+                    ms = _timestamp_ms(timestamp) + day_offset
+                    # 자정을 넘어가면 하루를 더함
+                    if previous_ms is not None and ms < previous_ms - _DAY_MS // 2:
+                        day_offset += _DAY_MS
+                        ms += _DAY_MS
+                    previous_ms = ms
+
+                    if direction == 'TX':
+                        last_tx_ms = ms
+                    elif last_tx_ms is not None:
+                        # 송신 후 첫 수신 라인만 응답으로 봄 (LineTiming.response_ns와 동일)
+                        latency = ms - last_tx_ms
+                        last_tx_ms = None
+                self.latency_ms.append(latency)
+        finally:
+            if hasattr(lines, 'close'):
+                lines.close()
+
+    def __len__(self):
+        return len(self.keys)
+
+
+def _middle_snake(a, a_lo, a_hi, b, b_lo, b_hi, max_d):
+    """Myers middle snake: (x_start, y_start, x_end, y_end) 또는 max_d 초과 시 None"""
+    n = a_hi - a_lo
+    m = b_hi - b_lo
+    delta = n - m
+    odd = delta & 1
+    # 탐색하는 대각선은 [-d_limit, d_limit] 범위이므로 배열 크기는 편집 거리에만 비례
+    d_limit = min((n + m + 1) // 2, max_d)
+    offset = d_limit + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+
+    for d in range(d_limit + 1):
+        # 정방향 탐색
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            x_start, y_start = x, y
+            while x < n and y < m and a[a_lo + x] == b[b_lo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            if odd and -(d - 1) <= delta - k <= d - 1 and x + backward[offset + delta - k] >= n:
+                return a_lo + x_start, b_lo + y_start, a_lo + x, b_lo + y
+
+        # 역방향 탐색 (뒤집은 좌표)
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            x_start, y_start = x, y
+            while x < n and y < m and a[a_hi - 1 - x] == b[b_hi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + k] = x
+            if not odd and -d <= delta - k <= d and x + forward[offset + delta - k] >= n:
+                return a_hi - x, b_hi - y, a_hi - x_start, b_hi - y_start
+
+    return None
+
+
+def _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi):
+    """구간 양쪽에 한 번씩만 나오는 라인 중 순서가 보존되는 최장 쌍 목록 [(a_index, b_index)]"""
+    a_counts = Counter(a[a_lo:a_hi])
+    b_counts = Counter(b[b_lo:b_hi])
+    a_unique = {key: index for index, key in enumerate(a[a_lo:a_hi], a_lo)
+                if a_counts[key] == 1 and b_counts[key] == 1}
+    if not a_unique:
+        return []
+
+    # b 순서로 나열한 a 위치의 최장 증가 부분 수열 (patience sorting)
+    pairs = [(a_unique[key], index) for index, key in enumerate(b[b_lo:b_hi], b_lo)
+             if key in a_unique]
+    tails = []
+    tail_pairs = []
+    previous = [None] * len(pairs)
+    for pair_index, (a_index, _) in enumerate(pairs):
+        pile = bisect_left(tails, a_index)
+        if pile:
+            previous[pair_index] = tail_pairs[pile - 1]
+        if pile == len(tails):
+            tails.append(a_index)
+            tail_pairs.append(pair_index)
+        else:
+            tails[pile] = a_index
+            tail_pairs[pile] = pair_index
+
+    anchors = []
+    pair_index = tail_pairs[-1]
+    while pair_index is not None:
+        anchors.append(pairs[pair_index])
+        pair_index = previous[pair_index]
+    anchors.reverse()
+    return anchors
+
+
+def _split_point(a, a_lo, a_hi, b, b_lo, b_hi):
+    """구간을 반으로 나눌 위치 (a_mid, b_mid, 일치 여부)
+
+    긴 쪽의 가운데를 기준으로 반대쪽 위치를 길이 비율로 추정하고, 추정 위치
+    주변에 같은 라인이 있으면 그 쌍에서 나눠 경계에서 일치 라인을 잃지 않게 한다.
+    """
+    if a_hi - a_lo >= b_hi - b_lo:
+        a_mid = (a_lo + a_hi) // 2
+        guess = b_lo + (b_hi - b_lo) * (a_mid - a_lo) // (a_hi - a_lo)
+        for offset in range(_SPLIT_SEARCH):
+            for b_mid in (guess + offset, guess - offset):
+                if b_lo <= b_mid < b_hi and b[b_mid] == a[a_mid]:
+                    return a_mid, b_mid, True
+        return a_mid, guess, False
+
+    b_mid = (b_lo + b_hi) // 2
+    guess = a_lo + (a_hi - a_lo) * (b_mid - b_lo) // (b_hi - b_lo)
+    for offset in range(_SPLIT_SEARCH):
+        for a_mid in (guess + offset, guess - offset):
+            if a_lo <= a_mid < a_hi and a[a_mid] == b[b_mid]:
+                return a_mid, b_mid, True
+    return guess, b_mid, False
+
+
+def _merge_blocks(blocks):
+    """정렬된 일치 구간 중 이어지는 구간 병합"""
+    merged = []
+    for a_index, b_index, length in blocks:
+        if merged:
+            last_a, last_b, last_length = merged[-1]
+            if last_a + last_length == a_index and last_b + last_length == b_index:
+                merged[-1] = (last_a, last_b, last_length + length)
+                continue
+        merged.append((a_index, b_index, length))
+    return merged
+
+
+def matching_blocks(a, b, max_edit_distance=DEFAULT_MAX_EDIT_DISTANCE):
+    """일치 구간 목록 [(a_index, b_index, length)] (오름차순)
+
+    편집 거리 상한을 넘을 수 있는 큰 구간은 작은 편집 거리로만 먼저 탐색해 보고,
+    실패하면 고유 라인 기준점으로 나누거나 기준점이 없으면 반으로 나눠 각각 다시 정렬한다.
+    """
+    blocks = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        a_lo, a_hi, b_lo, b_hi = stack.pop()
+
+        # 공통 접두어/접미어는 탐색 없이 일치 처리
+        start_a, start_b = a_lo, b_lo
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            a_lo += 1
+            b_lo += 1
+        if a_lo > start_a:
+            blocks.append((start_a, start_b, a_lo - start_a))
+        end_a = a_hi
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+        if a_hi < end_a:
+            blocks.append((a_hi, b_hi, end_a - a_hi))
+
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        if (a_hi - a_lo) + (b_hi - b_lo) <= 2 * max_edit_distance:
+            snake = _middle_snake(a, a_lo, a_hi, b, b_lo, b_hi, max_edit_distance)
+        else:
+            # 상한에 걸릴 수 있는 큰 구간: 편집 거리가 작은 경우(거의 같은 세션)만 바로 정렬하고
+            # 아니면 고유 라인 기준점으로 분할
+            snake = _middle_snake(a, a_lo, a_hi, b, b_lo, b_hi,
+                                  min(_PROBE_EDIT_DISTANCE, max_edit_distance))
+            if snake is None:
+                anchors = _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi)
+                if anchors:
+                    x_end, y_end = a_lo, b_lo
+                    for x, y in anchors:
+                        stack.append((x_end, x, y_end, y))
+                        blocks.append((x, y, 1))
+                        x_end, y_end = x + 1, y + 1
+                    stack.append((x_end, a_hi, y_end, b_hi))
+                    continue
+        if snake is None:
+            # 반으로 나눠 계속 정렬 (상한 안에 드는 작은 구간은 middle snake가 항상 성공)
+            a_mid, b_mid, matched = _split_point(a, a_lo, a_hi, b, b_lo, b_hi)
+            stack.append((a_mid + matched, a_hi, b_mid + matched, b_hi))
+            stack.append((a_lo, a_mid, b_lo, b_mid))
+            if matched:
+                blocks.append((a_mid, b_mid, 1))
+            continue
+        x_start, y_start, x_end, y_end = snake
+        if x_end > x_start:
+            blocks.append((x_start, y_start, x_end - x_start))
+        stack.append((x_end, a_hi, y_end, b_hi))
+        stack.append((a_lo, x_start, b_lo, y_start))
+
+    blocks.sort()
+    return _merge_blocks(blocks)
+
+
+class SessionDiff:
+    """두 세션의 비교 결과"""
+
+    def __init__(self, baseline, candidate, masks=None,
+                 latency_threshold_ms=DEFAULT_LATENCY_THRESHOLD_MS,
+                 max_edit_distance=DEFAULT_MAX_EDIT_DISTANCE):
+        masks = compile_masks(DEFAULT_MASKS if masks is None else masks)
+        self.baseline = SessionIndex(baseline, masks)
+        self.candidate = SessionIndex(candidate, masks)
+        self.latency_threshold_ms = latency_threshold_ms
+
+        self.blocks = matching_blocks(self.baseline.keys, self.candidate.keys, max_edit_distance)
+        self.hunks = self._hunks()
+        self._count_changes()
+        self._compare_latency()
+
+    def _hunks(self):
+        """일치 구간 사이의 차이 구간"""
+        hunks = []
+        a_pos = b_pos = 0
+        for a_index, b_index, length in self.blocks + [(len(self.baseline), len(self.candidate), 0)]:
+            if a_index > a_pos or b_index > b_pos:
+                hunks.append(Hunk(a_pos, a_index, b_pos, b_index))
+            a_pos, b_pos = a_index + length, b_index + length
+        return hunks
+
+    def _count_changes(self):
+        """구간별로 삭제/추가 라인을 짝지어 변경으로 집계"""
+        self.added = self.removed = self.changed = 0
+        for hunk in self.hunks:
+            removed = hunk.a_end - hunk.a_start
+            added = hunk.b_end - hunk.b_start
+            paired = min(removed, added)
+            self.changed += paired
+            self.removed += removed - paired
+            self.added += added - paired
+        self.unchanged = sum(length for _, _, length in self.blocks)
+
+    def _compare_latency(self):
+        """일치한 응답 라인의 응답 시간 차이"""
+        a_latency = self.baseline.latency_ms
+        b_latency = self.candidate.latency_ms
+        self.latency_pairs = 0
+        self.latency_delta_total_ms = 0
+        self.regressions = []
+        for a_index, b_index, length in self.blocks:
+            for offset in range(length):
+                a_ms = a_latency[a_index + offset]
+                b_ms = b_latency[b_index + offset]
+                if a_ms < 0 or b_ms < 0:
+                    continue
+                delta_ms = b_ms - a_ms
+                self.latency_pairs += 1
+                self.latency_delta_total_ms += delta_ms
+                if delta_ms > self.latency_threshold_ms:
+                    self.regressions.append(LatencyDelta(a_index + offset, b_index + offset,
+                                                         a_ms, b_ms, delta_ms))
+        self.regressions.sort(key=lambda regression: -regression.delta_ms)
+
+    @property
+    def has_differences(self):
+        return bool(self.hunks or self.regressions)
+
+    def collect_lines(self, session, indexes):
+        """필요한 인덱스의 라인 원문만 순차 읽기로 수집"""
+        wanted = {session.line_numbers[index]: index for index in indexes}
+        texts = {}
+        if not wanted:
+            return texts
+        last_line_no = max(wanted)
+        lines = open_lines(session.source)
+        try:
+            for line_no, line in enumerate(lines, 1):
+                if line_no in wanted:
+                    texts[wanted[line_no]] = line.rstrip('\r\n')
+                if line_no >= last_line_no:
+                    break
+        finally:
+            if hasattr(lines, 'close'):
+                lines.close()
+        return texts
+
+    def format_report(self, max_hunks=20, max_lines=10, max_regressions=20):
+        """텍스트 보고서 (구간/라인 수 제한)"""
+        shown_hunks = self.hunks[:max_hunks]
+        a_indexes, b_indexes = [], []
+        for hunk in shown_hunks:
+            a_indexes.extend(range(hunk.a_start, min(hunk.a_end, hunk.a_start + max_lines)))
+            b_indexes.extend(range(hunk.b_start, min(hunk.b_end, hunk.b_start + max_lines)))
+        shown_regressions = self.regressions[:max_regressions]
+        a_indexes.extend(regression.a_index for regression in shown_regressions)
+        b_indexes.extend(regression.b_index for regression in shown_regressions)
+        a_texts = self.collect_lines(self.baseline, a_indexes)
+        b_texts = self.collect_lines(self.candidate, b_indexes)
+
+        lines = [
+            f"기준: {self._source_name(self.baseline)} ({len(self.baseline)} 라인)",
+            f"비교: {self._source_name(self.candidate)} ({len(self.candidate)} 라인)",
+            f"일치 {self.unchanged}, 변경 {self.changed}, 추가 {self.added}, 삭제 {self.removed}",
+        ]
+        if self.latency_pairs:
+            mean_delta = self.latency_delta_total_ms / self.latency_pairs
+            lines.append(f"응답 시간: 비교 라인 {self.latency_pairs}개, 평균 차이 {mean_delta:+.1f} ms, "
+                         f"{self.latency_threshold_ms:g} ms 초과 지연 {len(self.regressions)}개")
+
+        for hunk in shown_hunks:
+            lines.append(f"\n@@ -{self._line_no(self.baseline, hunk.a_start)},{hunk.a_end - hunk.a_start} "
+                         f"+{self._line_no(self.candidate, hunk.b_start)},{hunk.b_end - hunk.b_start} @@")
+            for index in range(hunk.a_start, min(hunk.a_end, hunk.a_start + max_lines)):
+                lines.append(f"- {a_texts.get(index, '')}")
+            if hunk.a_end - hunk.a_start > max_lines:
+                lines.append(f"- ... ({hunk.a_end - hunk.a_start - max_lines} 라인 생략)")
+            for index in range(hunk.b_start, min(hunk.b_end, hunk.b_start + max_lines)):
+                lines.append(f"+ {b_texts.get(index, '')}")
+            if hunk.b_end - hunk.b_start > max_lines:
+                lines.append(f"+ ... ({hunk.b_end - hunk.b_start - max_lines} 라인 생략)")
+        if len(self.hunks) > max_hunks:
+            lines.append(f"\n... 차이 구간 {len(self.hunks) - max_hunks}개 생략")
+
+        if shown_regressions:
+            lines.append("\n=== 응답 시간 회귀 ===")
+            for regression in shown_regressions:
+                lines.append(f"{regression.a_ms} ms -> {regression.b_ms} ms ({regression.delta_ms:+d} ms) "
+                             f"{b_texts.get(regression.b_index, '')}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _source_name(session):
+        return session.source if isinstance(session.source, str) else "현재 세션"
+
+    @staticmethod
+    def _line_no(session, index):
+        if index < len(session.line_numbers):
+            return session.line_numbers[index]
+        return session.line_numbers[-1] + 1 if len(session.line_numbers) else 1
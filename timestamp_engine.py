@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+타임스탬프 엔진
+바이트 도착 시점을 time.monotonic_ns()로 기록하고 벽시계 시간에는 한 번만 고정(anchor)
+표시용 문자열은 초 단위 접두어("HH:MM:SS.")를 캐시해서 필요할 때만 만든다
+"""
+
+import time
+
+
+def byte_time_ns(baudrate, databits=8, parity='N', stopbits=1):
+    """한 문자(start + data + parity + stop 비트)의 전송 시간 (ns)"""
+    parity_bits = 0 if str(parity).upper().startswith('N') else 1
+    frame_bits = 1 + int(databits) + parity_bits + float(stopbits)
+    return int(frame_bits * 1_000_000_000 / baudrate)
+
+
+class ArrivalClock:
+    """단조 시계 기반 도착 시각 + 지연 포맷팅"""
+
+    def __init__(self):
+        self.anchor()
+
+    def anchor(self):
+        """벽시계와 단조 시계의 기준점 설정 (연결 시 한 번)"""
+        self.anchor_mono_ns = time.monotonic_ns()
+        self.anchor_wall_ns = time.time_ns()
+        self._prefix_cache = (None, "")
+
+    @staticmethod
+    def now():
+        """현재 단조 시각 (ns)"""
+        return time.monotonic_ns()
+
+    def to_wall_ns(self, mono_ns):
+        """단조 시각을 벽시계 시각(epoch ns)으로 변환"""
+        return self.anchor_wall_ns + (mono_ns - self.anchor_mono_ns)
+
+    def format(self, mono_ns):
+        """"HH:MM:SS.mmm" 형식 문자열 (같은 초 안에서는 접두어 재사용)"""
+        second, remainder = divmod(self.to_wall_ns(mono_ns), 1_000_000_000)
+        cached_second, prefix = self._prefix_cache
+        if second != cached_second:
+            prefix = time.strftime("%H:%M:%S.", time.localtime(second))
+            # 튜플 한 번에 교체하므로 여러 스레드에서 호출해도 안전
+            self._prefix_cache = (second, prefix)
+        return f"{prefix}{remainder // 1_000_000:03d}"
+
+
+def format_delta(delta_ns):
+    """라인 간격 표시 문자열 (" +12.345ms", 첫 라인이면 빈 문자열)"""
+    if delta_ns is None:
+        return ""
+    return f" {delta_ns / 1_000_000:+.3f}ms"
+
+
+class LineTiming:
+    """라인 간 간격과 송신 후 응답 시간 추적"""
+
+    def __init__(self):
+        self.last_line_ns = None
+        self.last_tx_ns = None
+
+    def line_delta_ns(self, mono_ns):
+        """직전 라인과의 간격 (첫 라인이면 None)"""
+        last, self.last_line_ns = self.last_line_ns, mono_ns
+        return None if last is None else mono_ns - last
+
+    def mark_tx(self, mono_ns):
+        """송신 시각 기록 (write() 호출 직전 시각)"""
+        self.last_tx_ns = mono_ns
+        self.line_delta_ns(mono_ns)
+
+    def response_ns(self, start_ns, end_ns=None):
+        """송신 후 첫 수신 라인까지의 응답 시간 (첫 라인이 아니면 None)
+
+        첫 바이트 시각은 역산한 추정값이라 송신 시각보다 앞설 수 있으므로
+        송신 전에 끝난 라인인지는 라인 끝(개행) 도착 시각으로 판단한다.
+        """
+        if self.last_tx_ns is None:
+            return None
+        if (start_ns if end_ns is None else end_ns) < self.last_tx_ns:
+            return None  # 송신 전에 이미 수신된 라인
+        last_tx, self.last_tx_ns = self.last_tx_ns, None
+        return max(start_ns - last_tx, 0)
+
+
+class LineAssembler:
+    """수신 청크를 라인 단위로 분리하고 라인 첫 바이트의 도착 시각을 추정
+
+    청크의 마지막 바이트가 읽기 시점(arrival_ns)에 도착했다고 보고, 그 앞 바이트들은
+    한 문자 전송 시간(byte_ns) 간격으로 역산한다. 이전 청크보다 앞설 수는 없으므로
+    직전 읽기 시점으로 하한을 둔다.
+    """
+
+    def __init__(self, byte_ns):
+        self.byte_ns = byte_ns
+        self.buffer = b""
+        self.line_start_ns = None
+        self.last_arrival_ns = None
+
+    def byte_arrival_ns(self, chunk_len, arrival_ns):
+        """청크 첫 바이트의 추정 도착 시각 (i번째 바이트 = 반환값 + i * byte_ns)"""
+        first_ns = arrival_ns - (chunk_len - 1) * self.byte_ns
+        if self.last_arrival_ns is not None and first_ns < self.last_arrival_ns:
+            first_ns = self.last_arrival_ns
+        return first_ns
+
+    def feed(self, data, arrival_ns):
+        """청크를 추가하고 완성된 라인 목록 [(첫 바이트 도착 ns, 개행 도착 ns, 라인 bytes)] 반환"""
+        first_ns = self.byte_arrival_ns(len(data), arrival_ns)
+        self.last_arrival_ns = arrival_ns
+        if not self.buffer:
+            self.line_start_ns = first_ns
+
+        lines = []
+        start = 0
+        index = data.find(b'\n')
+        while index != -1:
+            end_ns = min(first_ns + index * self.byte_ns, arrival_ns)
+            lines.append((self.line_start_ns, end_ns, self.buffer + data[start:index]))
+            self.buffer = b""
+            start = index + 1
+            self.line_start_ns = min(first_ns + start * self.byte_ns, arrival_ns)
+            index = data.find(b'\n', start)
+
+        self.buffer += data[start:]
+        return lines